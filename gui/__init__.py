@@ -5,7 +5,7 @@ GUI components for the Tello Drone Control application.
 from gui.drone_app import DroneApp, main
 from gui.ui_components import (
     StyledFrame, HeaderLabel, ControlButton, 
-    LogDisplay, StatusBar, ControlPanel, VlmPanel
+    LogDisplay, StatusBar, BasicStatusBar, ControlPanel, VlmPanel
 )
 from gui.camera_handler import CameraHandler
 from gui.command_handler import CommandHandler
@@ -7,6 +7,9 @@ import numpy as np
 import time
 import queue
 from threading import Lock
+import logging
+
+logger = logging.getLogger(__name__)
 
 class CameraHandler:
     """
@@ -28,9 +31,9 @@ class CameraHandler:
         try:
             from .. import drone_control
             self.tello = drone_control.tello
-            print("Tello drone initialized for camera handler")
+            logger.info("Tello drone initialized for camera handler")
         except Exception as e:
-            print(f"Error initializing Tello drone reference: {e}")
+            logger.error("Error initializing Tello drone reference: %s", e)
             self.tello = None
         
         # Initialize PC camera
@@ -41,12 +44,12 @@ class CameraHandler:
         try:
             self.pc_cam = cv2.VideoCapture(self.pc_camera_index)
             if not self.pc_cam.isOpened():
-                print(f"Warning: Could not open PC camera {self.pc_camera_index}")
+                logger.warning("Could not open PC camera %s", self.pc_camera_index)
                 self.active_camera = "drone"  # Default to drone if PC camera fails
                 return False
             return True
         except Exception as e:
-            print(f"Error initializing PC camera: {e}")
+            logger.error("Error initializing PC camera: %s", e)
             self.active_camera = "drone"
             return False
     
@@ -54,85 +57,94 @@ class CameraHandler:
         """Toggle between PC and drone camera."""
         with self.lock:
             if self.active_camera == "pc":
-                print("Switching to drone camera")
+                logger.info("Switching to drone camera")
                 self.active_camera = "drone"
                 return True
             else:
-                print("Switching to PC camera")
+                logger.info("Switching to PC camera")
                 self.active_camera = "pc"
                 # Verify PC camera is working
                 if not self.pc_cam or not self.pc_cam.isOpened():
                     if not self.initialize_pc_camera():
-                        print("PC camera not available, staying with drone camera")
+                        logger.info("PC camera not available, staying with drone camera")
                         self.active_camera = "drone"
                         return False
                 return True
     
     def get_frame(self):
-        """Get a frame from the active camera."""
+        """Get a frame from the active camera, or None if no frame could be read."""
         if not self.is_video_active:
             return None
-            
-        with self.lock:
-            frame = None
-            
-            if self.active_camera == "pc":
-                # Get PC camera frame
-                if self.pc_cam and self.pc_cam.isOpened():
-                    ret, frame = self.pc_cam.read()
-                    if not ret:
-                        print("Error reading PC camera frame, switching to drone camera")
-                        self.active_camera = "drone"
-                        # Try to get a drone frame instead
-                        try:
-                            if self.tello:
-                                frame = self.tello.get_frame_read().frame
-                                if frame is not None:
-                                    frame = self.color_correct_drone_frame(frame)
-                        except Exception as e:
-                            print(f"Error reading drone camera after PC camera failed: {e}")
-                            return None
-                    else:
-                        # Mirror PC camera for better UX
-                        frame = cv2.flip(frame, 1)
-                else:
-                    # PC camera not available, switch to drone
+        
+        try:
+            with self.lock:
+                return self._read_frame()
+        except Exception as e:
+            logger.error("Error getting camera frame: %s", e)
+            return None
+    
+    def _read_frame(self):
+        """Read a frame from the active camera. Caller must hold the lock."""
+        frame = None
+        
+        if self.active_camera == "pc":
+            # Get PC camera frame
+            if self.pc_cam and self.pc_cam.isOpened():
+                ret, frame = self.pc_cam.read()
+                if not ret:
+                    logger.error("Error reading PC camera frame, switching to drone camera")
                     self.active_camera = "drone"
+                    # Try to get a drone frame instead
                     try:
                         if self.tello:
                             frame = self.tello.get_frame_read().frame
                             if frame is not None:
                                 frame = self.color_correct_drone_frame(frame)
                     except Exception as e:
-                        print(f"Error reading drone camera: {e}")
+                        logger.error("Error reading drone camera after PC camera failed: %s", e)
                         return None
+                else:
+                    # Mirror PC camera for better UX
+                    frame = cv2.flip(frame, 1)
             else:
-                # Get drone camera frame
+                # PC camera not available, switch to drone
+                self.active_camera = "drone"
                 try:
                     if self.tello:
                         frame = self.tello.get_frame_read().frame
-                        if frame is None:
-                            print("Error getting drone camera frame, trying again")
-                            time.sleep(0.1)
-                            return None
-                        # Apply color correction to drone feed
-                        frame = self.color_correct_drone_frame(frame)
+                        if frame is not None:
+                            frame = self.color_correct_drone_frame(frame)
                 except Exception as e:
-                    print(f"Error reading drone camera: {e}")
+                    logger.error("Error reading drone camera: %s", e)
                     return None
-            
-            # Update frame queue for VLM
-            if frame is not None:
-                if not self.frame_queue.full():
-                    self.frame_queue.put(frame.copy())
-                else:
-                    try:
-                        self.frame_queue.get_nowait()
-                        self.frame_queue.put(frame.copy())
-                    except:
-                        pass
-            
-            return frame
+        else:
+            # Get drone camera frame
+            try:
+                if self.tello:
+                    frame = self.tello.get_frame_read().frame
+                    if frame is None:
+                        logger.error("Error getting drone camera frame, trying again")
+                        time.sleep(0.1)
+                        return None
+                    # Apply color correction to drone feed
+                    frame = self.color_correct_drone_frame(frame)
+            except Exception as e:
+                logger.error("Error reading drone camera: %s", e)
+                return None
+        
+        # Update frame queue for VLM
+        if frame is not None:
+            # Replace any frame the VLM has not picked up yet
+            try:
+                self.frame_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.frame_queue.put_nowait(frame.copy())
+            except queue.Full:
+                pass
+        
+        return frame
     
     def color_correct_drone_frame(self, frame):
         """Apply color correction to drone camera feed to reduce blue tint."""
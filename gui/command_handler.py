@@ -7,10 +7,25 @@ import time
 from threading import Thread, Event
 import sys
 import os
+import logging
+
+logger = logging.getLogger(__name__)
 
 # Add parent directory to path so we can import drone_control
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Map gestures to drone commands
+GESTURE_COMMANDS = {
+    "forward": "move_forward",
+    "backward": "move_back",
+    "left": "move_left",
+    "right": "move_right",
+    "up": "move_up",
+    "down": "move_down",
+    "flip": "flip_f",
+    "land": "land"
+}
+
 class CommandHandler:
     """
     Handler for processing and executing drone commands.
@@ -21,9 +36,9 @@ class CommandHandler:
         try:
             from .. import drone_control
             self.tello = drone_control.tello
-            print("Tello drone initialized for command handler")
+            logger.info("Tello drone initialized for command handler")
         except Exception as e:
-            print(f"Error initializing Tello drone reference: {e}")
+            logger.error("Error initializing Tello drone reference: %s", e)
             self.tello = None
             
         self.command_queue = command_queue if command_queue else queue.Queue(maxsize=5)
@@ -51,7 +66,7 @@ class CommandHandler:
         try:
             self.tello.send_rc_control(0, 0, 0, 0)
         except Exception as e:
-            print(f"Error stopping movement: {e}")
+            logger.error("Error stopping movement: %s", e)
     
     def start_processor(self):
         """Start the command processor thread."""
@@ -69,7 +84,7 @@ class CommandHandler:
     
     def command_processor(self):
         """Process commands from the queue based on active modality."""
-        print("Command processor started")
+        logger.info("Command processor started")
         
         while not self.stop_event.is_set():
             try:
@@ -88,7 +103,7 @@ class CommandHandler:
             except queue.Empty:
                 continue  # No command in queue
             except Exception as e:
-                print(f"Command processing error: {e}")
+                logger.error("Command processing error: %s", e)
                 # Ensure task_done is called even on error if item was retrieved
                 if 'command_input' in locals():
                     try: 
@@ -96,18 +111,18 @@ class CommandHandler:
                     except ValueError: 
                         pass  # Already marked done
         
-        print("Command processor stopped")
+        logger.info("Command processor stopped")
     
     def process_audio_command(self, command_text):
         """Process a command from speech recognition."""
-        print(f"Processing voice command: '{command_text}'")
+        logger.info("Processing voice command: '%s'", command_text)
         
         # Recognize the command
         drone_command = self.recognize_command(command_text)
         if drone_command not in ["Unknown Command", "Already Landed", "Already Flying"]:
             self.execute_command(drone_command)
         else:
-            print(f"Voice command ignored: {drone_command}")
+            logger.info("Voice command ignored: %s", drone_command)
     
     def process_vlm_command(self, command_text):
         """Process a command from VLM without controlling the drone."""
@@ -115,14 +130,14 @@ class CommandHandler:
         
         current_time = time.time()
         if current_time - self.last_vlm_command_time > self.vlm_cooldown:
-            print(f"Processing VLM query: '{command_text}'")
+            logger.info("Processing VLM query: '%s'", command_text)
             
             # Get the latest frame for processing
             frame = None
             try:
                 frame = self.frame_queue.get_nowait()
             except queue.Empty:
-                print("No frame available for VLM processing")
+                logger.info("No frame available for VLM processing")
                 return
                 
             self.last_vlm_command_time = current_time
@@ -140,30 +155,18 @@ class CommandHandler:
                 self.execute_command(drone_command)
                 
         else:
-            print(f"VLM query '{command_text}' skipped due to cooldown")
+            logger.info("VLM query '%s' skipped due to cooldown", command_text)
     
     def process_gesture_command(self, gesture_name):
         """Process a gesture command directly."""
         if not gesture_name:
             return
             
-        print(f"Processing gesture: {gesture_name}")
-        
-        # Map gestures to drone commands
-        gesture_mapping = {
-            "forward": "move_forward",
-            "backward": "move_back",
-            "left": "move_left",
-            "right": "move_right",
-            "up": "move_up",
-            "down": "move_down",
-            "flip": "flip_f",
-            "land": "land"
-        }
+        logger.info("Processing gesture: %s", gesture_name)
         
         # Execute the command if mapped
-        if gesture_name in gesture_mapping:
-            self.execute_command(gesture_mapping[gesture_name])
+        if gesture_name in GESTURE_COMMANDS:
+            self.execute_command(GESTURE_COMMANDS[gesture_name])
     
     def recognize_command(self, text):
         """Check if recognized text matches any drone command and convert to API command."""
@@ -239,18 +242,18 @@ class CommandHandler:
                     return "Already Flying"
                 return api_command
 
-        print(f"No matching command found for: '{text}'")
+        logger.info("No matching command found for: '%s'", text)
         return "Unknown Command"
     
     def execute_command(self, command):
         """Execute a drone command with feedback."""
         # Don't execute commands in idle mode
         if self.active_modality == "idle":
-            print(f"Command ignored (Idle mode): {command}")
+            logger.info("Command ignored (Idle mode): %s", command)
             return False
             
         try:
-            print(f"Executing command: {command}")
+            logger.info("Executing command: %s", command)
             
             # Execute the command based on type
             if command == "takeoff":
@@ -258,7 +261,7 @@ class CommandHandler:
                     self.tello.takeoff()
                     self.drone_in_air = True
                 else:
-                    print("Drone already in air")
+                    logger.info("Drone already in air")
                     return False
                     
             elif command == "land":
@@ -266,7 +269,7 @@ class CommandHandler:
                     self.tello.land()
                     self.drone_in_air = False
                 else:
-                    print("Drone already on ground")
+                    logger.info("Drone already on ground")
                     return False
                     
             elif command == "hover":
@@ -315,10 +318,10 @@ class CommandHandler:
                 elif command == "flip_r":
                     self.tello.flip("r")
                 else:
-                    print(f"Unknown command: {command}")
+                    logger.info("Unknown command: %s", command)
                     return False
             else:
-                print(f"Cannot execute '{command}' while landed. Try 'takeoff'.")
+                logger.info("Cannot execute '%s' while landed. Try 'takeoff'.", command)
                 return False
             
             # Call callback if provided
@@ -328,15 +331,15 @@ class CommandHandler:
             return True
             
         except Exception as e:
-            print(f"Error executing command '{command}': {e}")
+            logger.error("Error executing command '%s': %s", command, e)
             
             # Attempt to stabilize after error
             if self.drone_in_air:
                 try:
-                    print("Attempting to hover after error")
+                    logger.warning("Attempting to hover after error")
                     self.tello.send_rc_control(0, 0, 0, 0)
                 except Exception as hover_e:
-                    print(f"Could not stabilize after error: {hover_e}")
+                    logger.error("Could not stabilize after error: %s", hover_e)
             
             return False
     
@@ -346,7 +349,7 @@ class CommandHandler:
             self.command_queue.put(command_text)
             return True
         else:
-            print("Command queue full, discarding older command")
+            logger.info("Command queue full, discarding older command")
             try:
                 self.command_queue.get_nowait()
             except queue.Empty:
@@ -355,13 +358,13 @@ class CommandHandler:
                 self.command_queue.put_nowait(command_text)
                 return True
             except queue.Full:
-                print("Failed to add command to queue")
+                logger.error("Failed to add command to queue")
                 return False
     
     def emergency_land(self):
         """Emergency land the drone."""
         try:
-            print("EMERGENCY LANDING")
+            logger.warning("EMERGENCY LANDING")
             if self.drone_in_air:
                 self.tello.land()
                 self.drone_in_air = False
@@ -369,7 +372,7 @@ class CommandHandler:
             # Ensure connection ends cleanly
             self.tello.send_rc_control(0, 0, 0, 0)
         except Exception as e:
-            print(f"Error during emergency landing: {e}")
+            logger.error("Error during emergency landing: %s", e)
     
     def is_drone_flying(self):
         """Check if drone is currently in the air."""
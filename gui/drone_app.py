@@ -4,30 +4,28 @@ This integrates all components into a complete application.
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, font, PhotoImage
+from tkinter import ttk, PhotoImage
 import cv2
 import threading
 import queue
-import time
 import os
 import sys
-import platform
+import logging
 from functools import partial
-import builtins
 
 # Import our modules
-from utils.config import BUTTON_BG, HEADER_BG, FRAME_BG, ACCENT_COLOR, LOG_LEVELS, DEFAULT_MODE
-from utils.logger import logger, custom_print
+from utils.config import BUTTON_BG, HEADER_BG, FRAME_BG, ACCENT_COLOR, LOG_LEVELS, DEFAULT_MODE, Level
+from utils.logger import logger as gui_logger, GuiLogHandler
 
 # Import UI components
 from gui.ui_components import (
-    HeaderLabel, LogDisplay, StatusBar, 
+    HeaderLabel, LogDisplay, StatusBar, BasicStatusBar,
     ControlPanel, VlmPanel
 )
 
 # Import handlers
 from gui.camera_handler import CameraHandler
-from gui.command_handler import CommandHandler
+from gui.command_handler import CommandHandler, GESTURE_COMMANDS
 from gui.gesture_processor import GestureProcessor
 from gui.speech_handler import SpeechHandler
 
@@ -42,8 +40,72 @@ from drone_control import (
     WHISPER_MODEL, AUDIO_DEVICE_INDEX, PHRASE_TIME_LIMIT
 )
 
+logger = logging.getLogger(__name__)
+
+# Dialog text, built once at import
+_HELP_TEXT = """
+Tello Drone Control Help
+
+Keyboard Controls:
+- t: Takeoff
+- l: Land
+- Space: Hover
+- Arrow keys: Forward/Back/Left/Right
+- w/s: Up/Down
+- a/d: Rotate Left/Right
+- c: Toggle Camera
+- 1/2/3: Switch mode (Gesture/Audio/VLM)
+- 0: Idle mode
+
+Voice Commands:
+- "Take off"
+- "Land"
+- "Move forward/backward/left/right"
+- "Turn left/right"
+- "Move up/down"
+- "Hover"
+- "Flip forward/backward/left/right"
+
+Gestures (if model available):
+- Hand up: Move up
+- Hand down: Move down
+- Hand left/right: Move left/right
+- Open hand forward: Move forward
+- Open hand back: Move backward
+- Fist: Land
+"""
+_QUIT_PROMPT = "Do you want to quit? This will land the drone if it's flying."
+_GESTURE_UNAVAILABLE = "Gesture model not loaded. Cannot switch to gesture mode."
+
 class DroneApp(tk.Tk):
     """The main application window for the Tello Drone Control GUI."""
+    # Keyboard shortcuts: key -> (kind, argument)
+    _KEY_MAP = {
+        # Basic flight controls
+        "t": ("cmd", "takeoff"),
+        "l": ("cmd", "land"),
+        "<space>": ("cmd", "hover"),
+        
+        # Directional controls
+        "<Up>": ("cmd", "move_forward"),
+        "<Down>": ("cmd", "move_back"),
+        "<Left>": ("cmd", "move_left"),
+        "<Right>": ("cmd", "move_right"),
+        "w": ("cmd", "move_up"),
+        "s": ("cmd", "move_down"),
+        "a": ("cmd", "rotate_counter_clockwise"),
+        "d": ("cmd", "rotate_clockwise"),
+        
+        # Mode keys
+        "1": ("mode", "gesture"),
+        "2": ("mode", "audio"),
+        "3": ("mode", "vlm"),
+        "0": ("mode", "idle"),
+        
+        # Camera toggle
+        "c": ("special", "toggle_camera"),
+    }
+    
     def __init__(self):
         super().__init__()
         # Window setup
@@ -53,11 +115,15 @@ class DroneApp(tk.Tk):
         
         # Initialize queues before any handlers
         self.command_queue = queue.Queue(maxsize=10)
-        self.log_queue = queue.Queue(maxsize=100)
         
         # Thread control flags
         self.keep_alive_active = True
         
+        # Video display scaling and PPM header, chosen once per source resolution
+        self._video_src_size = None
+        self._video_scale = 1
+        self._ppm_header = b""
+        
         # Initialize UI containers first
         self.setup_ui_containers()
         
@@ -65,16 +131,17 @@ class DroneApp(tk.Tk):
         self.log_display = LogDisplay(self.right_frame, height=10)
         self.log_display.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Set up the custom print function to use our logger
-        # But keep a reference to the original print
-        self._original_print = builtins.print
-        builtins.print = self.custom_print
+        # Route application logging records to the log display
+        gui_logger.set_gui_instance(self)
+        self._log_handler = GuiLogHandler()
+        logging.getLogger().addHandler(self._log_handler)
         
         # Complete the UI setup
         self.setup_ui_components()
         
         # Initialize handlers AFTER log_display is created
         self.setup_handlers()
+        self.build_gesture_button_table()
         
         self.setup_styles()
         self.setup_keyboard_controls()
@@ -83,7 +150,7 @@ class DroneApp(tk.Tk):
         self.after(500, self.update_ui)
         
         # Log initial message to confirm GUI is operational
-        print("Tello Drone Control GUI Initialized")
+        logger.info("Tello Drone Control GUI Initialized")
 
     def setup_ui_containers(self):
         """Set up the main UI containers."""
@@ -137,11 +204,16 @@ class DroneApp(tk.Tk):
             # Initialize speech handler - at this point log_display is available
             self.speech_handler = SpeechHandler(command_queue=self.command_queue)
             
-            print("All handlers initialized successfully")
+            logger.info("All handlers initialized successfully")
         except Exception as e:
-            self._original_print(f"Error initializing handlers: {e}")
+            logger.error("Error initializing handlers: %s", e)
             # Continue with UI setup to avoid crashing completely
 
+    def build_gesture_button_table(self):
+        """Precompute gesture label index -> drone command lookup for button highlighting."""
+        labels = self.gesture_handler.label_names if self.gesture_handler else ()
+        self._label_commands = tuple(GESTURE_COMMANDS.get(str(label)) for label in labels)
+
     def setup_ui_components(self):
         """Set up the UI components after handlers are initialized."""
         # Initialize attribute storage
@@ -243,7 +315,7 @@ class DroneApp(tk.Tk):
             self.control_panel = ControlPanel(self.right_frame, command_callback=self.execute_command)
             self.control_panel.pack(fill=tk.X, padx=10, pady=10)
         except Exception as e:
-            self.safe_print(f"Error creating control panel: {e}")
+            logger.error("Error creating control panel: %s", e)
             # Create an empty frame as placeholder
             self.control_panel = tk.Frame(self.right_frame)
             self.control_panel.pack(fill=tk.X, padx=10, pady=10)
@@ -253,7 +325,7 @@ class DroneApp(tk.Tk):
             self.vlm_panel = VlmPanel(self.right_frame, command_callback=self.send_vlm_command)
             self.vlm_panel.pack(fill=tk.X, padx=10, pady=10)
         except Exception as e:
-            self.safe_print(f"Error creating VLM panel: {e}")
+            logger.error("Error creating VLM panel: %s", e)
             # Create an empty frame as placeholder
             self.vlm_panel = tk.Frame(self.right_frame)
             self.vlm_panel.pack(fill=tk.X, padx=10, pady=10)
@@ -263,43 +335,13 @@ class DroneApp(tk.Tk):
             self.status_bar = StatusBar(self)
             self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         except Exception as e:
-            self.safe_print(f"Error creating status bar: {e}")
+            logger.error("Error creating status bar: %s", e)
             # Use basic status bar as fallback
-            self.status_bar = tk.Frame(self, height=20, bg="#f0f0f0")
+            self.status_bar = BasicStatusBar(self)
             self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         
         # Log initial status
-        self.log("UI components initialized", "INFO")
-    
-    def custom_print(self, *args, **kwargs):
-        """Custom print function that logs to both console and GUI."""
-        # Print to the original console
-        self._original_print(*args, **kwargs)
-        
-        # Format the message
-        message = " ".join(str(arg) for arg in args)
-        
-        # Add to GUI log if log_display exists and is ready
-        if hasattr(self, 'log_display') and self.log_display:
-            # Add timestamp
-            timestamp = time.strftime("%H:%M:%S")
-            log_message = f"[{timestamp}] {message}"
-            
-            # Add to log queue (thread-safe) if available
-            if hasattr(self, 'log_queue') and not self.log_queue.full():
-                try:
-                    self.log_queue.put(log_message)
-                    # Schedule the log to be displayed (from main thread)
-                    self.after_idle(self.process_log_queue)
-                except Exception:
-                    pass  # Silently handle queue errors
-    
-    def safe_print(self, message):
-        """Safe print function that avoids recursion."""
-        if hasattr(self, '_original_print'):
-            self._original_print(message)
-        else:
-            print(message)  # Fallback to standard print
+        self.log("UI components initialized", Level.INFO)
     
     def setup_styles(self):
         """Configure ttk styles for the application."""
@@ -309,6 +351,7 @@ class DroneApp(tk.Tk):
             style.theme_use("clam")
         
         # Custom fonts
+        from tkinter import font
         self.custom_font = font.nametofont("TkDefaultFont").copy()
         self.custom_font.configure(size=10)
         self.header_font = font.Font(family="Helvetica", size=12, weight="bold")
@@ -343,124 +386,122 @@ class DroneApp(tk.Tk):
     
     def setup_keyboard_controls(self):
         """Set up keyboard shortcuts."""
-        # Basic flight controls
-        self.bind("t", lambda e: self.handle_key_press("takeoff"))
-        self.bind("l", lambda e: self.handle_key_press("land"))
-        self.bind("<space>", lambda e: self.handle_key_press("hover"))
-        
-        # Directional controls
-        self.bind("<Up>", lambda e: self.handle_key_press("move_forward"))
-        self.bind("<Down>", lambda e: self.handle_key_press("move_back"))
-        self.bind("<Left>", lambda e: self.handle_key_press("move_left"))
-        self.bind("<Right>", lambda e: self.handle_key_press("move_right"))
-        self.bind("w", lambda e: self.handle_key_press("move_up"))
-        self.bind("s", lambda e: self.handle_key_press("move_down"))
-        self.bind("a", lambda e: self.handle_key_press("rotate_counter_clockwise"))
-        self.bind("d", lambda e: self.handle_key_press("rotate_clockwise"))
-        
-        # Mode keys
-        self.bind("1", lambda e: self.set_modality("gesture"))
-        self.bind("2", lambda e: self.set_modality("audio"))
-        self.bind("3", lambda e: self.set_modality("vlm"))
-        self.bind("0", lambda e: self.set_modality("idle"))
-        
-        # Camera toggle
-        self.bind("c", lambda e: self.toggle_camera())
+        for key, (kind, arg) in self._KEY_MAP.items():
+            self.bind(key, partial(self._dispatch_key, kind, arg))
+    
+    def _dispatch_key(self, kind, arg, event):
+        """Route a bound key to its command, mode switch or special action."""
+        if kind == "cmd":
+            return self.handle_key_press(arg)
+        elif kind == "mode":
+            self.set_modality(arg)
+        elif arg == "toggle_camera":
+            self.toggle_camera()
     
     def handle_key_press(self, command):
         """Handle keyboard command."""
         # Only process if not in VLM or idle mode
         if self.command_handler.active_modality not in ["vlm", "idle"]:
-            self.log(f"Keyboard command: {command}", "COMMAND")
+            self.log(f"Keyboard command: {command}", Level.COMMAND)
             self.execute_command(command)
             return "break"  # Prevent default behavior
         elif self.command_handler.active_modality == "idle":
-            self.log(f"Command ignored (Idle mode): {command}", "INFO")
+            self.log(f"Command ignored (Idle mode): {command}", Level.INFO)
             return "break"
     
-    def log(self, message, level="INFO"):
+    def log(self, message, level=Level.INFO):
         """Add a log message to the log display."""
         self.log_display.add_log(message, level)
     
     def clear_log(self):
         """Clear the log display."""
         self.log_display.clear()
-        logger.clear()
+        gui_logger.clear()
     
     def update_ui(self):
         """Update the UI components periodically."""
-        # Update battery level
+        # Single safety net for the whole tick; handlers deal with their own errors
         try:
-            if hasattr(self, 'status_bar') and self.status_bar:
-                battery = tello.get_battery()
-                self.status_bar.update_battery(battery)
+            self.refresh_ui()
         except Exception as e:
-            if hasattr(self, 'log_display') and self.log_display:
-                self.log(f"Error getting battery level: {e}", "ERROR")
-        
-        # Update flight status if command_handler exists
-        if hasattr(self, 'command_handler') and self.command_handler and hasattr(self, 'status_bar') and self.status_bar:
-            try:
-                self.status_bar.update_flight_status(
-                    "In Flight" if self.command_handler.is_drone_flying() else "Landed"
-                )
-            except Exception:
-                pass
-        
-        # Update video feed if camera_handler exists
-        if hasattr(self, 'camera_handler') and self.camera_handler:
-            try:
-                self.update_video_feed()
-            except Exception as e:
-                if hasattr(self, 'log_display') and self.log_display:
-                    self.log(f"Error updating video feed: {e}", "ERROR")
-        
-        # Update logs from queue
-        if hasattr(self, 'log_queue') and self.log_queue:
-            try:
-                self.update_logs()
-            except Exception:
-                pass
+            self.log(f"Error updating UI: {e}", Level.ERROR)
         
         # Schedule next update (every 100ms)
         self.after(100, self.update_ui)
     
-    def update_logs(self):
-        """Update log display from the log queue."""
-        while not self.log_queue.empty():
-            try:
-                log_entry = self.log_queue.get_nowait()
-                self.log(log_entry["message"], log_entry["level"])
-            except queue.Empty:
-                break
+    def refresh_ui(self):
+        """Refresh video feed, status and log display once."""
+        # Update video feed if camera_handler exists (it handles its own errors)
+        if self.camera_handler:
+            self.update_video_feed()
+        
+        # Update battery level
+        self.status_bar.update_battery(self.read_battery())
+        
+        # Update flight status if command_handler exists
+        if self.command_handler:
+            self.status_bar.update_flight_status(
+                "In Flight" if self.command_handler.is_drone_flying() else "Landed"
+            )
+        
+        # Write log entries the logger has flushed since the last tick
+        gui_logger.flush_to_display()
+    
+    def read_battery(self):
+        """Get the drone battery level, or None if it cannot be read."""
+        try:
+            return tello.get_battery()
+        except Exception:
+            return None
     
     def update_video_feed(self):
         """Update the video feed with current frame and process gestures if active."""
+        try:
+            self.show_next_frame()
+        except Exception as e:
+            logger.error("Error updating video feed: %s", e)
+    
+    def show_next_frame(self):
+        """Display the current camera frame, running gesture recognition if active."""
         frame = self.camera_handler.get_frame()
         if frame is None:
             return
         
         # Process the frame for gestures if in gesture mode
         if self.command_handler.active_modality == "gesture":
-            gesture, processed_frame = self.gesture_handler.process_frame(frame)
+            label_idx, processed_frame = self.gesture_handler.process_frame(frame)
             
             # Execute gesture command if detected
-            if gesture:
+            if label_idx is not None:
+                gesture = self.gesture_handler.label_name(label_idx)
                 self.command_handler.process_gesture_command(gesture)
                 
                 # Update status with detected gesture
                 self.status_bar.update_command(f"Gesture: {gesture}")
                 
                 # Highlight corresponding control button
-                self.highlight_active_button(gesture)
+                self.highlight_gesture_button(label_idx)
         else:
             # Just use the frame without gesture processing if not in gesture mode
             processed_frame = frame
         
         # Convert to Tkinter-compatible image
         img = cv2.cvtColor(processed_frame, cv2.COLOR_BGR2RGB)
-        img = cv2.resize(img, (640, 480))  # Resize for display
-        img = PhotoImage(data=cv2.imencode('.ppm', img)[1].tobytes())
+        if processed_frame.shape[:2] != self._video_src_size:
+            # Only re-pick the downsample path when the source resolution changes
+            self._video_src_size = processed_frame.shape[:2]
+            height, width = self._video_src_size
+            self._video_scale = max(1, width // 640)
+            if self._video_scale < 2:
+                width, height = 640, 480
+            self._ppm_header = f"P6\n{width} {height}\n255\n".encode("ascii")
+        if self._video_scale < 2:
+            img = cv2.resize(img, (640, 480), interpolation=cv2.INTER_AREA)  # Resize for display
+        # PPM is just a fixed header plus raw RGB bytes, so skip cv2.imencode
+        img = PhotoImage(data=self._ppm_header + img.tobytes())
+        if self._video_scale >= 2:
+            # Integer downsample inside Tk: strided copy, no interpolation
+            img = img.subsample(self._video_scale, self._video_scale)
         
         # Update video label
         self.video_label.configure(image=img)
@@ -471,13 +512,20 @@ class DroneApp(tk.Tk):
         # Check control panel buttons
         self.control_panel.highlight_button(command)
         
-        # Check other buttons
+        # Check other buttons (plain tk buttons, so press them via relief)
         if command in self.active_buttons:
-            self.active_buttons[command].state(['pressed'])
+            self.active_buttons[command].config(relief=tk.SUNKEN)
             
         # Schedule button reset
         self.after(500, lambda: self.reset_button_highlight(command))
     
+    def highlight_gesture_button(self, label_idx):
+        """Highlight the button for the command mapped to a gesture label index."""
+        if label_idx < len(self._label_commands):
+            command = self._label_commands[label_idx]
+            if command:
+                self.highlight_active_button(command)
+    
     def reset_button_highlight(self, command):
         """Reset button highlight after a delay."""
         # Reset control panel buttons
@@ -485,7 +533,7 @@ class DroneApp(tk.Tk):
         
         # Reset other buttons
         if command in self.active_buttons:
-            self.active_buttons[command].state(['!pressed'])
+            self.active_buttons[command].config(relief=tk.RAISED)
     
     def start_threads(self):
         """Start background threads."""
@@ -504,16 +552,21 @@ class DroneApp(tk.Tk):
         if new_modality != current_modality:
             # Check if gesture model is available for gesture mode
             if new_modality == "gesture" and not self.gesture_handler.is_available():
-                messagebox.showwarning("Modality Warning", "Gesture model not loaded. Cannot switch to gesture mode.")
+                from tkinter import messagebox
+                messagebox.showwarning("Modality Warning", _GESTURE_UNAVAILABLE)
                 self.modality_var.set(current_modality)  # Revert selection
                 return
                 
             # Log the change
-            self.log(f"Switching to {new_modality.upper()} mode", "INFO")
+            self.log(f"Switching to {new_modality.upper()} mode", Level.INFO)
             
             # Update command handler
             self.command_handler.set_modality(new_modality)
             
+            # Forget gestures recognised in the previous mode
+            if self.gesture_handler:
+                self.gesture_handler.reset_prediction()
+            
             # Update status display
             self.status_bar.update_mode(new_modality)
             self.status_bar.update_command(f"Switched to {new_modality.upper()} mode")
@@ -538,11 +591,11 @@ class DroneApp(tk.Tk):
             success = self.camera_handler.switch_camera()
             
             if success:
-                self.log(f"Switched to {new_camera.upper()} camera", "INFO")
+                self.log(f"Switched to {new_camera.upper()} camera", Level.INFO)
             else:
                 # If switch failed, revert the selection
                 self.camera_var.set(self.camera_handler.get_active_camera())
-                self.log(f"Failed to switch to {new_camera} camera", "ERROR")
+                self.log(f"Failed to switch to {new_camera} camera", Level.ERROR)
     
     def toggle_camera(self):
         """Toggle between PC and drone camera (keyboard shortcut)."""
@@ -592,7 +645,8 @@ class DroneApp(tk.Tk):
     
     def on_close(self):
         """Handle window closing."""
-        if messagebox.askokcancel("Quit", "Do you want to quit? This will land the drone if it's flying."):
+        from tkinter import messagebox
+        if messagebox.askokcancel("Quit", _QUIT_PROMPT):
             # Set flags to stop all threads
             self.keep_alive_active = False
             
@@ -603,6 +657,9 @@ class DroneApp(tk.Tk):
             if hasattr(self, 'command_handler') and self.command_handler:
                 self.command_handler.stop_processor()
             
+            if hasattr(self, 'gesture_handler') and self.gesture_handler:
+                self.gesture_handler.stop()
+            
             # Land the drone if flying
             if hasattr(self, 'command_handler') and self.command_handler and self.command_handler.is_drone_flying():
                 self.command_handler.emergency_land()
@@ -615,97 +672,72 @@ class DroneApp(tk.Tk):
                 tello.streamoff()
                 tello.end()
             except Exception as e:
-                self.safe_print(f"Error during tello cleanup: {e}")
+                logger.error("Error during tello cleanup: %s", e)
             
+            logging.getLogger().removeHandler(self._log_handler)
             self.destroy()
             sys.exit(0)
 
     def toggle_voice_recognition(self):
         """Toggle voice recognition on/off."""
         if self.voice_var.get():
-            print("Enabling voice recognition...")
+            logger.info("Enabling voice recognition...")
             if hasattr(self, 'speech_handler') and self.speech_handler:
                 self.speech_handler.start_listening()
-                self.log("Voice recognition enabled", "SPEECH")
+                self.log("Voice recognition enabled", Level.SPEECH)
         else:
-            print("Disabling voice recognition...")
+            logger.info("Disabling voice recognition...")
             if hasattr(self, 'speech_handler') and self.speech_handler:
                 self.speech_handler.stop_listening()
-                self.log("Voice recognition disabled", "SPEECH")
+                self.log("Voice recognition disabled", Level.SPEECH)
 
     def toggle_gesture_recognition(self):
         """Toggle gesture recognition on/off."""
         if self.gesture_var.get():
-            print("Enabling gesture recognition...")
+            logger.info("Enabling gesture recognition...")
             if hasattr(self, 'command_handler') and self.command_handler:
                 self.command_handler.set_modality("gesture")
-                self.log("Gesture recognition enabled", "GESTURE")
+                if self.gesture_handler:
+                    self.gesture_handler.reset_prediction()
+                self.log("Gesture recognition enabled", Level.GESTURE)
         else:
-            print("Disabling gesture recognition...")
+            logger.info("Disabling gesture recognition...")
             if hasattr(self, 'command_handler') and self.command_handler:
                 self.command_handler.set_modality("idle")
-                self.log("Gesture recognition disabled", "GESTURE")
+                if self.gesture_handler:
+                    self.gesture_handler.reset_prediction()
+                self.log("Gesture recognition disabled", Level.GESTURE)
 
     def toggle_camera_feed(self):
         """Toggle camera feed on/off."""
         if self.camera_var.get():
-            print("Enabling camera feed...")
+            logger.info("Enabling camera feed...")
             if hasattr(self, 'camera_handler') and self.camera_handler:
                 self.camera_handler.start_video()
-                self.log("Camera feed enabled", "INFO")
+                self.log("Camera feed enabled", Level.INFO)
         else:
-            print("Disabling camera feed...")
+            logger.info("Disabling camera feed...")
             if hasattr(self, 'camera_handler') and self.camera_handler:
                 self.camera_handler.stop_video()
-                self.log("Camera feed disabled", "INFO")
+                self.log("Camera feed disabled", Level.INFO)
 
     def toggle_drone_camera(self):
         """Toggle between drone and PC camera."""
         if self.drone_camera_var.get():
-            print("Switching to drone camera...")
+            logger.info("Switching to drone camera...")
             if hasattr(self, 'camera_handler') and self.camera_handler:
                 self.camera_handler.set_active_camera("drone")
-                self.log("Switched to drone camera", "INFO")
+                self.log("Switched to drone camera", Level.INFO)
         else:
-            print("Switching to PC camera...")
+            logger.info("Switching to PC camera...")
             if hasattr(self, 'camera_handler') and self.camera_handler:
                 self.camera_handler.set_active_camera("pc")
-                self.log("Switched to PC camera", "INFO")
+                self.log("Switched to PC camera", Level.INFO)
 
     def show_help(self):
         """Show help dialog."""
-        help_text = """
-        Tello Drone Control Help
-        
-        Keyboard Controls:
-        - t: Takeoff
-        - l: Land
-        - Space: Hover
-        - Arrow keys: Forward/Back/Left/Right
-        - w/s: Up/Down
-        - a/d: Rotate Left/Right
-        - c: Toggle Camera
-        - 1/2/3: Switch mode (Gesture/Audio/VLM)
-        - 0: Idle mode
-        
-        Voice Commands:
-        - "Take off"
-        - "Land"
-        - "Move forward/backward/left/right"
-        - "Turn left/right"
-        - "Move up/down"
-        - "Hover"
-        - "Flip forward/backward/left/right"
-        
-        Gestures (if model available):
-        - Hand up: Move up
-        - Hand down: Move down
-        - Hand left/right: Move left/right
-        - Open hand forward: Move forward
-        - Open hand back: Move backward
-        - Fist: Land
-        """
-        messagebox.showinfo("Help", help_text)
+        from tkinter import messagebox
+        messagebox.showinfo("Help", _HELP_TEXT)
 
 # Main entry point
 def main():
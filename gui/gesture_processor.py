@@ -3,10 +3,22 @@ Gesture recognition and processing for the Tello Drone Control application.
 """
 
 import cv2
-import mediapipe as mp
 import numpy as np
-import tensorflow as tf
 import time
+import os
+import hashlib
+import queue
+import threading
+import logging
+
+try:
+    from tflite_runtime.interpreter import Interpreter
+except ImportError:
+    Interpreter = None  # fall back to tf.lite.Interpreter from full TensorFlow
+
+from utils.config import GESTURE_TFLITE_PATH
+
+logger = logging.getLogger(__name__)
 
 class GestureProcessor:
     """
@@ -17,98 +29,308 @@ class GestureProcessor:
         self.gesture_model = gesture_model
         self.gesture_labels = gesture_labels or {}
         
-        # Initialize MediaPipe hands
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(max_num_hands=1, min_detection_confidence=0.7)
-        self.mp_draw = mp.solutions.drawing_utils
+        # Label index -> name table, so the hot path only deals in integers
+        size = max(self.gesture_labels, default=-1) + 1
+        width = max((len(str(name)) for name in self.gesture_labels.values()), default=0)
+        self.label_names = np.full(size, "unknown", dtype=f"U{max(width, len('unknown'))}")
+        for idx, name in self.gesture_labels.items():
+            self.label_names[idx] = name
+        
+        # Initialize MediaPipe hands; it is only imported when there is a model to feed
+        self.mp_hands = None
+        self.hands = None
+        self.mp_draw = None
+        if self.gesture_model is not None:
+            import mediapipe as mp
+            self.mp_hands = mp.solutions.hands
+            # Lite landmark model (model_complexity=0) for lower latency
+            self.hands = self.mp_hands.Hands(max_num_hands=1, model_complexity=0,
+                                             min_detection_confidence=0.7)
+            self.mp_draw = mp.solutions.drawing_utils
+        
+        # MediaPipe sees frames downscaled to this width (aspect ratio preserved)
+        self.detection_width = 480
+        
+        # Reused downscale and RGB buffers for MediaPipe input, and BGR buffer for the annotated frame
+        self._small_buf = None
+        self._rgb_buf = None
+        self._annot_buf = None
+        
+        # Cheap skin-colour gate that skips MediaPipe on frames without a hand
+        self.skin_pixel_threshold = 100  # skin pixels needed in the 80x60 thumbnail
+        self.detection_latch_frames = 15  # keep running MediaPipe this long after a hand
+        self._frames_since_hand = self.detection_latch_frames
+        
+        # Reuse the last prediction while the hand barely moves
+        self.landmark_delta_threshold = 3.0  # L2 distance over all landmark pixel coords
+        self._last_lm = None
+        self._last_pred = None  # (class index, confidence)
         
         # Gesture tracking variables
         self.pred_gesture = ""
-        self.temp_gesture = ""
+        self.temp_index = -1
         self.gesture_count = 0
         self.last_gesture_time = 0
         self.gesture_cooldown = 0.5  # seconds between gestures
+        
+        # Run the classifier through an FP16 TFLite interpreter instead of Keras
+        self.interpreter = None
+        if self.gesture_model is not None:
+            self.init_interpreter()
+        
+        # Inference runs on a worker fed from a size-1 slot (newest frame wins)
+        self._frame_slot = queue.Queue(maxsize=1)
+        self._result_lock = threading.Lock()
+        self._pending_index = None  # confirmed gesture not yet handed to the UI
+        self._last_hand = None  # latest landmarks, drawn on every displayed frame
+        self._stop_event = threading.Event()
+        self._worker = None
+        if self.gesture_model is not None:
+            self._worker = threading.Thread(target=self.inference_worker,
+                                            name="GestureInference", daemon=True)
+            self._worker.start()
+    
+    def init_interpreter(self):
+        """Load (or build and cache) the FP16 TFLite version of the gesture model."""
+        try:
+            # The cache is only valid for the exact Keras model it was built from
+            key = self.model_fingerprint()
+            key_path = GESTURE_TFLITE_PATH + ".key"
+            tflite_model = None
+            if os.path.exists(GESTURE_TFLITE_PATH) and os.path.exists(key_path):
+                with open(key_path) as f:
+                    cached_key = f.read().strip()
+                if cached_key == key:
+                    with open(GESTURE_TFLITE_PATH, "rb") as f:
+                        tflite_model = f.read()
+            
+            if tflite_model is None:
+                tflite_model = self.convert_to_tflite()
+                try:
+                    with open(GESTURE_TFLITE_PATH, "wb") as f:
+                        f.write(tflite_model)
+                    with open(key_path, "w") as f:
+                        f.write(key)
+                except OSError as e:
+                    # The conversion itself succeeded, so keep using it
+                    logger.error("Could not cache TFLite gesture model: %s", e)
+            
+            # The small tflite_runtime wheel is enough to run the cached model;
+            # TensorFlow is only imported when it is missing or a conversion is needed
+            interpreter_cls = Interpreter
+            if interpreter_cls is None:
+                import tensorflow as tf
+                interpreter_cls = tf.lite.Interpreter
+            
+            # Default XNNPACK delegate runs the FP16 weights with fused FP32 kernels
+            self.interpreter = interpreter_cls(model_content=tflite_model, num_threads=2)
+            self.interpreter.allocate_tensors()
+            
+            # Pre-fetch tensor accessors for the hot path
+            self._input_tensor = self.interpreter.tensor(self.interpreter.get_input_details()[0]["index"])
+            self._out_idx = self.interpreter.get_output_details()[0]["index"]
+            logger.info("Gesture model loaded as FP16 TFLite: %s", GESTURE_TFLITE_PATH)
+        except Exception as e:
+            logger.error("Error building TFLite gesture model, falling back to Keras: %s", e)
+            self.interpreter = None
+    
+    def model_fingerprint(self):
+        """Hash the Keras model's architecture and weights to key the TFLite cache."""
+        digest = hashlib.sha1(self.gesture_model.to_json().encode())
+        for weights in self.gesture_model.get_weights():
+            digest.update(np.ascontiguousarray(weights).tobytes())
+        return digest.hexdigest()
+    
+    def convert_to_tflite(self):
+        """Convert the Keras gesture model to a TFLite model with FP16 weights."""
+        import tensorflow as tf
+        
+        converter = tf.lite.TFLiteConverter.from_keras_model(self.gesture_model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+        return converter.convert()
+    
+    def predict_tflite(self, landmarks):
+        """Run the interpreter on one landmark vector and return class scores."""
+        # Write straight into the interpreter's input buffer; the view must not
+        # outlive this statement or invoke() will refuse to run
+        self._input_tensor()[0, :] = landmarks
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self._out_idx)[0]
     
     def process_frame(self, frame, display_frame=None):
         """
         Process a frame for hand gestures.
         
+        The frame is handed to the inference worker and this call returns
+        immediately with the most recent inference results.
+        
         Args:
-            frame: The original camera frame
+            frame: The original camera frame (must not be modified afterwards)
             display_frame: Optional frame for visualization (if None, original frame is used)
             
         Returns:
-            gesture: Detected gesture name or None
-            processed_frame: Frame with hand landmarks drawn
+            label_idx: Index of a newly confirmed gesture label or None
+                (use label_name() to get its name)
+            processed_frame: Frame with the latest hand landmarks drawn. This is a
+                buffer reused across calls; copy it if it must outlive the next call.
         """
         if frame is None:
             return None, None
             
-        # Use provided display frame or make a copy
-        processed_frame = display_frame.copy() if display_frame is not None else frame.copy()
+        # Copy the provided display frame (or the original) into the reused annotation buffer
+        source = display_frame if display_frame is not None else frame
+        if self._annot_buf is None or self._annot_buf.shape != source.shape:
+            self._annot_buf = np.empty_like(source)
+        np.copyto(self._annot_buf, source)
+        processed_frame = self._annot_buf
         
         # If no gesture model, just return the frame
         if self.gesture_model is None:
             return None, processed_frame
+        
+        # Publish the frame, replacing one the worker has not picked up yet
+        try:
+            self._frame_slot.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self._frame_slot.put_nowait(frame)
+        except queue.Full:
+            pass
+        
+        # Draw the latest landmarks on the display frame
+        hand_landmarks = self._last_hand
+        if hand_landmarks is not None:
+            self.mp_draw.draw_landmarks(processed_frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
+        
+        with self._result_lock:
+            label_idx, self._pending_index = self._pending_index, None
+        return label_idx, processed_frame
+    
+    def inference_worker(self):
+        """Run hand detection and classification on published frames."""
+        while not self._stop_event.is_set():
+            try:
+                frame = self._frame_slot.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            
+            try:
+                label_idx = self.detect_gesture(frame)
+            except Exception as e:
+                logger.error("Gesture prediction error: %s", e)
+                continue
             
-        # Convert to RGB for MediaPipe
-        rgb_img = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb_img)
+            if label_idx is not None:
+                with self._result_lock:
+                    self._pending_index = label_idx
+    
+    def detect_gesture(self, frame):
+        """
+        Run MediaPipe and the gesture classifier on one frame.
         
-        # No hands detected
-        if not results.multi_hand_landmarks:
-            self.temp_gesture = ""
+        Returns:
+            label_idx: Index of a gesture held long enough to trigger, or None
+        """
+        # Skip MediaPipe when nothing skin-coloured is visible, unless a hand was just seen
+        if self._frames_since_hand >= self.detection_latch_frames and not self.has_skin_region(frame):
+            self._last_hand = None
+            self._last_lm = None
+            self.temp_index = -1
             self.gesture_count = 0
-            return None, processed_frame
+            return None
             
-        # Extract landmarks
-        landmarks = []
+        # Downscale and convert to RGB for MediaPipe into buffers allocated once per frame size
         h, w, _ = frame.shape
+        small_w = min(w, self.detection_width)
+        small_h = max(1, round(h * small_w / w))
+        if self._rgb_buf is None or self._rgb_buf.shape[:2] != (small_h, small_w):
+            self._small_buf = np.empty((small_h, small_w, 3), dtype=frame.dtype)
+            self._rgb_buf = np.empty_like(self._small_buf)
+        if small_w < w:
+            cv2.resize(frame, (small_w, small_h), dst=self._small_buf, interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(self._small_buf, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        else:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
         
-        for hand_landmarks in results.multi_hand_landmarks:
-            # Draw landmarks on the display frame
-            self.mp_draw.draw_landmarks(processed_frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
-            
-            # Extract x, y coordinates
-            for lm in hand_landmarks.landmark:
-                landmarks.append(lm.x * w)
-                landmarks.append(lm.y * h)
-                
-        # Predict gesture
+        # Read-only input lets MediaPipe skip its own copy
+        self._rgb_buf.flags.writeable = False
         try:
-            # Reshape landmarks for model input
-            landmarks_array = tf.expand_dims(landmarks, axis=0)
+            results = self.hands.process(self._rgb_buf)
+        finally:
+            # Restore even if MediaPipe raises, or the next cvtColor into it fails
+            self._rgb_buf.flags.writeable = True
+        
+        # No hands detected
+        if not results.multi_hand_landmarks:
+            self._last_hand = None
+            self._last_lm = None
+            self._frames_since_hand += 1
+            self.temp_index = -1
+            self.gesture_count = 0
+            return None
+        self._frames_since_hand = 0
             
-            # Get prediction from model
-            predictions = self.gesture_model.predict(landmarks_array, verbose=0)
-            predicted_class = np.argmax(predictions[0])
-            confidence = predictions[0][predicted_class]
+        # Only one hand is tracked (max_num_hands=1)
+        hand_landmarks = results.multi_hand_landmarks[0]
+        self._last_hand = hand_landmarks
+        
+        # Extract interleaved x, y coordinates and scale to original-frame pixels in one pass
+        # (landmarks are normalized, so the downscale needs no correction)
+        points = hand_landmarks.landmark
+        landmarks = np.fromiter((v for lm in points for v in (lm.x, lm.y)),
+                                dtype=np.float32, count=2 * len(points))
+        landmarks[0::2] *= w
+        landmarks[1::2] *= h
+        
+        # Get prediction from model, unless the hand has hardly moved since the last one
+        if (self._last_lm is not None and
+                np.linalg.norm(landmarks - self._last_lm) < self.landmark_delta_threshold):
+            predicted_class, confidence = self._last_pred
+        else:
+            if self.interpreter is not None:
+                predictions = self.predict_tflite(landmarks)
+            else:
+                predictions = self.gesture_model.predict(landmarks[None, :], verbose=0)[0]
+            predicted_class = int(np.argmax(predictions))
+            confidence = predictions[predicted_class]
+            self._last_lm = landmarks
+            self._last_pred = (predicted_class, confidence)
+        
+        # Check if confidence is high enough
+        if confidence > 0.9:
+            # Check if same gesture is sustained
+            if predicted_class == self.temp_index:
+                self.gesture_count += 1
+            else:
+                self.temp_index = predicted_class
+                self.gesture_count = 0
             
-            # Check if confidence is high enough
-            if confidence > 0.9:
-                gesture_name = self.gesture_labels.get(predicted_class, "unknown")
-                
-                # Check if same gesture is sustained
-                if gesture_name == self.temp_gesture:
-                    self.gesture_count += 1
-                else:
-                    self.temp_gesture = gesture_name
+            # Number of consistent frames required for a gesture
+            if self.gesture_count >= 5:
+                # Check cooldown
+                current_time = time.time()
+                if current_time - self.last_gesture_time > self.gesture_cooldown:
+                    self.pred_gesture = self.label_name(predicted_class)
                     self.gesture_count = 0
-                
-                # Number of consistent frames required for a gesture
-                if self.gesture_count >= 5:
-                    # Check cooldown
-                    current_time = time.time()
-                    if current_time - self.last_gesture_time > self.gesture_cooldown:
-                        self.pred_gesture = gesture_name
-                        self.gesture_count = 0
-                        self.last_gesture_time = current_time
-                        return gesture_name, processed_frame
-            
-        except Exception as e:
-            print(f"Gesture prediction error: {e}")
+                    self.last_gesture_time = current_time
+                    return predicted_class
         
-        return None, processed_frame
+        return None
+    
+    def has_skin_region(self, frame):
+        """Check a downsampled YCrCb skin mask for anything hand-sized."""
+        small = cv2.resize(frame, (80, 60), interpolation=cv2.INTER_AREA)
+        ycrcb = cv2.cvtColor(small, cv2.COLOR_BGR2YCrCb)
+        mask = cv2.inRange(ycrcb, (0, 133, 77), (255, 173, 127))
+        return cv2.countNonZero(mask) >= self.skin_pixel_threshold
+    
+    def label_name(self, label_idx):
+        """Get the gesture name for a label index."""
+        if 0 <= label_idx < len(self.label_names):
+            return str(self.label_names[label_idx])
+        return "unknown"
     
     def get_last_predicted_gesture(self):
         """Get the last predicted gesture."""
@@ -117,8 +339,13 @@ class GestureProcessor:
     def reset_prediction(self):
         """Reset the gesture prediction."""
         self.pred_gesture = ""
-        self.temp_gesture = ""
+        self.temp_index = -1
         self.gesture_count = 0
+        self._last_lm = None
+        self._last_hand = None
+        # Drop a gesture the worker confirmed but the UI has not acted on yet
+        with self._result_lock:
+            self._pending_index = None
     
     def set_cooldown(self, seconds):
         """Set the cooldown between gestures."""
@@ -126,4 +353,11 @@ class GestureProcessor:
     
     def is_available(self):
         """Check if gesture recognition is available."""
-        return self.gesture_model is not None 
\ No newline at end of file
+        return self.gesture_model is not None
+    
+    def stop(self):
+        """Stop the inference worker thread."""
+        self._stop_event.set()
+        if self._worker:
+            self._worker.join(timeout=1)
+            self._worker = None 
\ No newline at end of file
@@ -3,22 +3,17 @@ Speech recognition module for the Tello Drone Control application.
 """
 
 import speech_recognition as sr
-import time
 import queue
 import threading
-import builtins
+import logging
 from .whisper_processor import WhisperProcessor, CommandProcessor
 
-# Original print for direct console output
-_original_print = builtins.print
+logger = logging.getLogger(__name__)
 
 class SpeechHandler:
     """Handles speech recognition for voice commands."""
     def __init__(self, command_queue, device_index=None, model="tiny", phrase_time_limit=5):
-        """Initialize the speech recognition handler.
-        
-        Note: During initialization, only console output should be used.
-        The GUI logger will not be available until later."""
+        """Initialize the speech recognition handler."""
         self.command_queue = command_queue
         self.device_index = device_index
         self.model = model
@@ -28,132 +23,151 @@ class SpeechHandler:
         self.audio_processor = None
         self.listener_thread = None
         self.is_listening = False
+        
+        # Capture runs in speech_recognition's background thread and hands
+        # phrases to the transcription worker through a small queue
+        self._audio_queue = queue.Queue(maxsize=3)
+        self._stop_background = None
         self.command_processor = CommandProcessor()
         
         # Initialize whisper if available
         try:
             self.audio_processor = WhisperProcessor(model=model)
-            # Use direct console print during initialization to avoid GUI logging
-            _original_print(f"Whisper initialized with model: {model}")
+            logger.info("Whisper initialized with model: %s", model)
         except Exception as e:
-            _original_print(f"Error initializing Whisper: {e}")
+            logger.error("Error initializing Whisper: %s", e)
         
-        # Print available microphones using direct console print
+        # Log available microphones
         self.print_available_mics()
         
         # Try to select the microphone
         try:
             self.microphone = sr.Microphone(device_index=device_index)
-            _original_print(f"Microphone initialized with device index: {device_index}")
+            logger.info("Microphone initialized with device index: %s", device_index)
         except Exception as e:
-            _original_print(f"Error initializing microphone: {e}")
-    
-    def safe_print(self, message):
-        """Print safely regardless of GUI state."""
-        # Always print to console using the original print
-        _original_print(message)
+            logger.error("Error initializing microphone: %s", e)
     
     def print_available_mics(self):
-        """List all available microphones using direct console print."""
+        """Log all available microphones."""
         try:
             mic_list = sr.Microphone.list_microphone_names()
-            _original_print("Available microphones:")
+            logger.info("Available microphones:")
             for i, mic in enumerate(mic_list):
-                _original_print(f"  {i}: {mic}")
+                logger.info("  %s: %s", i, mic)
         except Exception as e:
-            _original_print(f"Error listing microphones: {e}")
+            logger.error("Error listing microphones: %s", e)
     
     def adjust_for_ambient_noise(self):
         """Adjust for ambient noise to improve recognition accuracy."""
         if not self.microphone:
-            self.safe_print("No microphone available for ambient noise adjustment")
+            logger.warning("No microphone available for ambient noise adjustment")
             return False
         
         try:
-            self.safe_print("Adjusting for ambient noise... (please be quiet)")
+            logger.info("Adjusting for ambient noise... (please be quiet)")
             with self.microphone as source:
                 self.recognizer.adjust_for_ambient_noise(source, duration=1)
-            self.safe_print(f"Adjusted energy threshold: {self.recognizer.energy_threshold}")
+            logger.debug("Adjusted energy threshold: %s", self.recognizer.energy_threshold)
             return True
         except Exception as e:
-            self.safe_print(f"Error adjusting for ambient noise: {e}")
+            logger.error("Error adjusting for ambient noise: %s", e)
             return False
     
     def start_listening(self):
-        """Start the speech recognition listener in a separate thread."""
+        """Start background audio capture and the transcription worker thread."""
         if self.is_listening:
-            self.safe_print("Already listening")
+            logger.warning("Already listening")
             return
         
         if not self.microphone:
-            self.safe_print("No microphone available")
+            logger.warning("No microphone available")
             return
         
         # First adjust for ambient noise
         if not self.adjust_for_ambient_noise():
             return
         
-        # Start listening thread
+        # Start transcription worker
         self.is_listening = True
-        self.listener_thread = threading.Thread(target=self.listen_for_commands)
+        self.listener_thread = threading.Thread(target=self.transcribe_worker)
         self.listener_thread.daemon = True
         self.listener_thread.start()
-        self.safe_print("Speech recognition started")
+        
+        # Capture keeps running while earlier phrases are being transcribed
+        self._stop_background = self.recognizer.listen_in_background(
+            self.microphone, self._on_audio, phrase_time_limit=self.phrase_time_limit
+        )
+        logger.info("Speech recognition started")
     
     def stop_listening(self):
-        """Stop the speech recognition listener."""
+        """Stop background audio capture and the transcription worker."""
         self.is_listening = False
+        if self._stop_background:
+            self._stop_background(wait_for_stop=False)
+            self._stop_background = None
         if self.listener_thread:
             # Wait for thread to terminate
             self.listener_thread.join(timeout=1)
             self.listener_thread = None
-        self.safe_print("Speech recognition stopped")
+        
+        # Drop phrases captured but not yet transcribed
+        while True:
+            try:
+                self._audio_queue.get_nowait()
+            except queue.Empty:
+                break
+        logger.info("Speech recognition stopped")
     
-    def listen_for_commands(self):
-        """Listen for voice commands and process them."""
+    def _on_audio(self, recognizer, audio):
+        """Receive a captured phrase from the background listener."""
+        try:
+            self._audio_queue.put_nowait(audio)
+        except queue.Full:
+            logger.warning("Transcription backlog full, dropping phrase")
+    
+    def transcribe_worker(self):
+        """Transcribe captured phrases and process them as commands."""
         while self.is_listening:
             try:
-                with self.microphone as source:
-                    self.safe_print("Listening for commands...")
-                    audio = self.recognizer.listen(source, phrase_time_limit=self.phrase_time_limit)
-                    self.safe_print("Processing audio...")
+                audio = self._audio_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            
+            try:
+                logger.debug("Processing audio...")
                 
                 # Process with Whisper
                 if self.audio_processor:
                     text = self.audio_processor.process_audio(audio)
                     if text:
-                        self.safe_print(f"Recognized: {text}")
+                        logger.info("Recognized: %s", text)
                         self.process_command(text)
                     else:
-                        self.safe_print("Could not recognize audio")
+                        logger.warning("Could not recognize audio")
                 else:
-                    self.safe_print("Whisper processor not available")
-            
-            except sr.WaitTimeoutError:
-                self.safe_print("No speech detected within timeout")
+                    logger.warning("Whisper processor not available")
             except Exception as e:
-                self.safe_print(f"Error in speech recognition: {e}")
-                time.sleep(1)  # Prevent rapid error loops
+                logger.error("Error in speech recognition: %s", e)
     
     def process_command(self, text):
         """Process a recognized command."""
         command = self.command_processor.process_text(text)
         if command:
-            self.safe_print(f"Command detected: {command}")
+            logger.info("Command detected: %s", command)
             self.add_to_queue(command)
         else:
-            self.safe_print("No command detected in text")
+            logger.info("No command detected in text")
     
     def add_to_queue(self, command):
         """Add a command to the queue."""
         try:
             if not self.command_queue.full():
                 self.command_queue.put(command)
-                self.safe_print(f"Added command to queue: {command}")
+                logger.debug("Added command to queue: %s", command)
             else:
-                self.safe_print("Command queue is full")
+                logger.warning("Command queue is full")
         except Exception as e:
-            self.safe_print(f"Error adding command to queue: {e}")
+            logger.error("Error adding command to queue: %s", e)
     
     def set_device_index(self, device_index):
         """Set the microphone device index."""
@@ -167,9 +181,9 @@ class SpeechHandler:
         # Reinitialize microphone
         try:
             self.microphone = sr.Microphone(device_index=device_index)
-            self.safe_print(f"Microphone set to device index: {device_index}")
+            logger.info("Microphone set to device index: %s", device_index)
         except Exception as e:
-            self.safe_print(f"Error setting microphone: {e}")
+            logger.error("Error setting microphone: %s", e)
         
         # Resume listening if it was active
         if was_listening:
@@ -177,9 +191,12 @@ class SpeechHandler:
     
     def set_model(self, model):
         """Set the Whisper model."""
+        if model == self.model and self.audio_processor:
+            return  # Keep the warm instance
+        
         try:
             self.audio_processor = WhisperProcessor(model=model)
             self.model = model
-            self.safe_print(f"Whisper model set to: {model}")
+            logger.info("Whisper model set to: %s", model)
         except Exception as e:
-            self.safe_print(f"Error setting Whisper model: {e}") 
\ No newline at end of file
+            logger.error("Error setting Whisper model: %s", e)
\ No newline at end of file
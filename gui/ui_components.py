@@ -5,6 +5,10 @@ UI Components for the Tello Drone Control application.
 import tkinter as tk
 from tkinter import ttk, font, scrolledtext
 import time
+import collections
+
+from utils.config import Level
+from utils.logger import LogEntry, to_level
 
 class StyledFrame(ttk.Frame):
     """A styled frame with consistent appearance."""
@@ -32,21 +36,53 @@ class LogDisplay(scrolledtext.ScrolledText):
         self.config(state=tk.DISABLED)  # Make read-only
         
         # Configure tags for different log levels
-        from utils.config import LOG_LEVELS
-        for level, color in LOG_LEVELS.items():
-            self.tag_configure(level, foreground=color)
+        from utils.config import LEVEL_NAMES, LEVEL_COLORS, LOG_QUEUE_SIZE
+        for name, color in zip(LEVEL_NAMES, LEVEL_COLORS):
+            self.tag_configure(name, foreground=color)
+        self._level_tags = LEVEL_NAMES
+        
+        # Entries waiting for the next idle flush; if producers outpace Tk,
+        # only the newest LOG_QUEUE_SIZE are kept
+        self._pending = collections.deque(maxlen=LOG_QUEUE_SIZE)
+        self._flush_scheduled = False
+    
+    def add_log(self, message, level=Level.INFO):
+        """Queue a log entry with timestamp; entries are written in batches when Tk is idle."""
+        self._pending.append(LogEntry(time.strftime("%H:%M:%S"), to_level(level), message))
+        self._schedule_flush()
     
-    def add_log(self, message, level="INFO"):
-        """Add a log entry with timestamp and appropriate color."""
+    def _schedule_flush(self):
+        """Arrange for pending entries to be written once Tk is idle."""
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_logs)
+    
+    def _flush_logs(self):
+        """Write all pending log entries."""
+        self._flush_scheduled = False
+        entries = list(self._pending)
+        self._pending.clear()
+        self.write_logs(entries)
+    
+    def write_logs(self, entries):
+        """Write LogEntry records with a single insert call; Tk thread only."""
+        if not entries:
+            return
+        
+        # Alternating text/tag arguments let Tk insert the whole batch at once
+        chunks = []
+        tags = self._level_tags
+        for entry in entries:
+            chunks.extend((f"[{entry.ts}] ", "TIMESTAMP", f"{entry.msg}\n", tags[entry.level]))
+        
         self.config(state=tk.NORMAL)
-        timestamp = time.strftime("%H:%M:%S")
-        self.insert(tk.END, f"[{timestamp}] ", "TIMESTAMP")
-        self.insert(tk.END, f"{message}\n", level)
+        self.insert(tk.END, *chunks)
         self.see(tk.END)  # Auto-scroll to bottom
         self.config(state=tk.DISABLED)
     
     def clear(self):
         """Clear all logs."""
+        self._pending.clear()
         self.config(state=tk.NORMAL)
         self.delete(1.0, tk.END)
         self.config(state=tk.DISABLED)
@@ -92,8 +128,8 @@ class StatusBar(ttk.Frame):
         ttk.Label(cmd_frame, textvariable=self.command_var).pack(side=tk.LEFT)
     
     def update_battery(self, value):
-        """Update the battery level."""
-        self.battery_var.set(f"{value}%")
+        """Update the battery level (None if it could not be read)."""
+        self.battery_var.set("-- %" if value is None else f"{value}%")
     
     def update_flight_status(self, status):
         """Update the flight status."""
@@ -107,6 +143,23 @@ class StatusBar(ttk.Frame):
         """Update the current command."""
         self.command_var.set(command)
 
+class BasicStatusBar(tk.Frame):
+    """Plain fallback status bar; accepts the StatusBar updates and ignores them."""
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, height=20, bg="#f0f0f0", **kwargs)
+    
+    def update_battery(self, value):
+        """Ignore the battery level."""
+    
+    def update_flight_status(self, status):
+        """Ignore the flight status."""
+    
+    def update_mode(self, mode):
+        """Ignore the control mode."""
+    
+    def update_command(self, command):
+        """Ignore the current command."""
+
 class ControlPanel(ttk.LabelFrame):
     """A control panel with directional controls."""
     def __init__(self, parent, command_callback, **kwargs):
@@ -228,6 +281,13 @@ class VlmPanel(ttk.LabelFrame):
                                                      borderwidth=1, relief="sunken")
         self.response_text.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
         self.response_text.config(state=tk.DISABLED)
+        
+        # Fonts and tags for styling different parts, created once
+        self._ts_font = font.Font(family="Helvetica", size=9, weight="bold")
+        self._q_font = font.Font(family="Helvetica", size=9, slant="italic")
+        self.response_text.tag_configure("timestamp", foreground="#0066cc", font=self._ts_font)
+        self.response_text.tag_configure("query", foreground="#009933", font=self._q_font)
+        self.response_text.tag_configure("response", foreground="#333333")
     
     def on_send(self):
         """Handle the send button click."""
@@ -247,13 +307,6 @@ class VlmPanel(ttk.LabelFrame):
         
         self.response_text.insert(tk.END, formatted_response)
         
-        # Add tags for styling different parts
-        self.response_text.tag_configure("timestamp", foreground="#0066cc", 
-                                       font=font.Font(family="Helvetica", size=9, weight="bold"))
-        self.response_text.tag_configure("query", foreground="#009933", 
-                                       font=font.Font(family="Helvetica", size=9, slant="italic"))
-        self.response_text.tag_configure("response", foreground="#333333")
-        
         # Apply tags
         self.response_text.tag_add("timestamp", "1.0", "1.10")
         self.response_text.tag_add("query", "1.11", "2.0")
@@ -2,8 +2,21 @@
 Audio processing module for whisper-based speech recognition.
 """
 
-import speech_recognition as sr
+import numpy as np
 import time
+import logging
+from faster_whisper import WhisperModel
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # fall back to plain substring scans
+
+logger = logging.getLogger(__name__)
+
+# Loaded Whisper models, keyed by (model name, compute type), so switching
+# models back and forth does not reload weights from disk
+_MODEL_CACHE = {}
 
 class WhisperProcessor:
     """
@@ -18,10 +31,11 @@ class WhisperProcessor:
                 "tiny", "base", "small", "medium", "large"
         """
         self.model = model
-        self.recognizer = sr.Recognizer()
-        # Initialize energy threshold for better detection
-        self.recognizer.energy_threshold = 300
-        self.recognizer.dynamic_energy_threshold = True
+        # CTranslate2 backend with int8 weights, loaded once per process
+        key = (model, "int8")
+        if key not in _MODEL_CACHE:
+            _MODEL_CACHE[key] = WhisperModel(model, device="cpu", compute_type="int8")
+        self.whisper = _MODEL_CACHE[key]
         
     def process_audio(self, audio):
         """
@@ -34,18 +48,22 @@ class WhisperProcessor:
             str: Transcribed text or empty string on failure
         """
         try:
-            # Return transcribed text using Whisper
-            text = self.recognizer.recognize_whisper(audio, language="english", model=self.model)
-            print(f"Whisper recognized: '{text}'")
-            return text.strip()
-        except sr.UnknownValueError:
-            print("Whisper could not understand audio")
-            return ""
-        except sr.RequestError as e:
-            print(f"Could not request results from Whisper service; {e}")
-            return ""
+            # Whisper expects 16 kHz mono float32 samples in [-1, 1]; resample once
+            # here and hand faster-whisper the array so it never decodes or resamples
+            raw = audio.get_raw_data(convert_rate=16000, convert_width=2)
+            samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32)
+            samples *= 1.0 / 32768.0  # scale in place, no second buffer
+            
+            # Greedy decoding; the VAD filter trims silence around short commands
+            segments, _ = self.whisper.transcribe(samples, language="en", beam_size=1, vad_filter=True)
+            text = "".join(segment.text for segment in segments).strip()
+            if not text:
+                logger.info("Whisper could not understand audio")
+                return ""
+            logger.info("Whisper recognized: '%s'", text)
+            return text
         except Exception as e:
-            print(f"Error processing audio with Whisper: {e}")
+            logger.error("Error processing audio with Whisper: %s", e)
             return ""
 
 
@@ -57,7 +75,7 @@ class CommandProcessor:
         """Initialize the command processor with command keywords."""
         # Define command keywords and their variations
         self.command_keywords = {
-            "takeoff": ["take off", "takeoff", "start", "begin flight", "take of", "takeoff", "start flying"],
+            "takeoff": ["take off", "takeoff", "start", "begin flight", "take of", "start flying"],
             "land": ["land", "stop", "go down", "descend fully", "ground", "go landing", "land now"],
             "move forward": ["move forward", "go forward", "fly forward", "forward", "ahead", "straight", "front"],
             "move backward": ["move backward", "go back", "fly backward", "backward", "reverse", "back", "behind"],
@@ -74,6 +92,36 @@ class CommandProcessor:
             "flip right": ["flip right", "do a right flip", "right flip"],
         }
         
+        # Reverse variation -> command table for exact utterances; a phrase
+        # listed under several commands keeps the first one
+        self._exact = {}
+        for command, variations in self.command_keywords.items():
+            for variation in variations:
+                self._exact.setdefault(variation, command)
+        
+        # All (variation, command) pairs, longest variation first, so the
+        # substring fallback can stop at its first hit
+        self._sorted = sorted(
+            ((variation, command) for command, variations in self.command_keywords.items()
+             for variation in variations),
+            key=lambda pair: -len(pair[0])
+        )
+        
+        # Compile every variation into one Aho-Corasick automaton so partial
+        # matching is a single pass over the text. A phrase listed under several
+        # commands keeps the first one, and each payload carries its declaration
+        # index so equal-length ties resolve like the stable sorted fallback.
+        self.automaton = None
+        if ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for index, (variation, command) in enumerate(
+                (variation, command) for command, variations in self.command_keywords.items()
+                for variation in variations
+            ):
+                if variation not in self.automaton:
+                    self.automaton.add_word(variation, ((len(variation), -index), command))
+            self.automaton.make_automaton()
+        
     def process_text(self, text):
         """
         Process text to identify drone commands.
@@ -90,16 +138,24 @@ class CommandProcessor:
         text = text.lower().strip()
         
         # First check for exact matches
-        for command, variations in self.command_keywords.items():
-            if text in variations:
-                return command
+        command = self._exact.get(text)
+        if command:
+            return command
                 
-        # Then check for partial matches (if a variation is contained in the text)
-        for command, variations in self.command_keywords.items():
-            for variation in variations:
+        # Then check for partial matches, preferring the longest variation found
+        # (so "stop moving" wins over "stop")
+        if self.automaton is not None:
+            best = None
+            for _, (rank, command) in self.automaton.iter(text):
+                if best is None or rank > best[0]:
+                    best = (rank, command)
+            if best:
+                return best[1]
+        else:
+            for variation, command in self._sorted:
                 if variation in text:
                     return command
                     
         # No command detected
-        print(f"No command detected in: '{text}'")
+        logger.info("No command detected in: '%s'", text)
         return None 
\ No newline at end of file
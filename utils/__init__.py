@@ -2,10 +2,18 @@
 Utility modules for the Tello Drone Control application.
 """
 
-from utils.config import *
-from utils.logger import logger, custom_print
+from utils.config import (
+    PROJECT_DIR, BUTTON_BG, HEADER_BG, FRAME_BG, ACCENT_COLOR,
+    Level, LEVEL_NAMES, LEVEL_COLORS, LOG_LEVELS, MODES, DEFAULT_MODE,
+    GESTURE_TFLITE_PATH, VLM_COOLDOWN,
+    COMMAND_QUEUE_SIZE, FRAME_QUEUE_SIZE, LOG_QUEUE_SIZE, MAX_LOG_MSG_LEN
+)
+from utils.logger import logger, custom_print, GuiLogHandler
 
-# Import builtins, but DON'T replace print yet to avoid recursion
-# The replacement will be done in the main.py when needed
-import builtins
-# builtins.print = custom_print  # <-- Commented out to avoid recursion error 
\ No newline at end of file
+__all__ = [
+    "PROJECT_DIR", "BUTTON_BG", "HEADER_BG", "FRAME_BG", "ACCENT_COLOR",
+    "Level", "LEVEL_NAMES", "LEVEL_COLORS", "LOG_LEVELS", "MODES", "DEFAULT_MODE",
+    "GESTURE_TFLITE_PATH", "VLM_COOLDOWN",
+    "COMMAND_QUEUE_SIZE", "FRAME_QUEUE_SIZE", "LOG_QUEUE_SIZE", "MAX_LOG_MSG_LEN",
+    "logger", "custom_print", "GuiLogHandler",
+]
@@ -2,31 +2,54 @@
 Configuration settings for the Tello Drone Control application.
 """
 
+import os
+from enum import IntEnum
+
+# Project root (one level above utils/)
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 # Style constants
 BUTTON_BG = "#f0f0f0"
 HEADER_BG = "#e1e1e1"
 FRAME_BG = "#f5f5f5"
 ACCENT_COLOR = "#3498db"
 
-# Log levels with colors
-LOG_LEVELS = {
-    "INFO": "#0066cc",     # Blue
-    "ERROR": "#cc0000",    # Red
-    "COMMAND": "#009933",  # Green
-    "GESTURE": "#9933cc",  # Purple
-    "SPEECH": "#cc6600",   # Orange
-    "VLM": "#663300",      # Brown
-    "DEBUG": "#666666"     # Gray
-}
+# Log levels, used as indexes into the name and color tables below
+class Level(IntEnum):
+    INFO = 0
+    ERROR = 1
+    COMMAND = 2
+    GESTURE = 3
+    SPEECH = 4
+    VLM = 5
+    DEBUG = 6
+
+LEVEL_NAMES = tuple(level.name for level in Level)
+LEVEL_COLORS = (
+    "#0066cc",  # INFO: Blue
+    "#cc0000",  # ERROR: Red
+    "#009933",  # COMMAND: Green
+    "#9933cc",  # GESTURE: Purple
+    "#cc6600",  # SPEECH: Orange
+    "#663300",  # VLM: Brown
+    "#666666"   # DEBUG: Gray
+)
+
+# Log levels with colors, keyed by name
+LOG_LEVELS = dict(zip(LEVEL_NAMES, LEVEL_COLORS))
 
 # Control modes
 MODES = ["gesture", "audio", "vlm", "idle"]
 DEFAULT_MODE = "idle"
 
+# Gesture settings
+GESTURE_TFLITE_PATH = os.path.join(PROJECT_DIR, "gesture-model-fp16.tflite")  # cached TFLite conversion, keyed by a ".key" sidecar
+
 # VLM settings
 VLM_COOLDOWN = 3  # seconds between VLM queries
 
 # Queue settings
 COMMAND_QUEUE_SIZE = 5
 FRAME_QUEUE_SIZE = 1
-LOG_QUEUE_SIZE = 100 
\ No newline at end of file
+LOG_QUEUE_SIZE = 100
+MAX_LOG_MSG_LEN = 2048  # longer log messages are truncated 
\ No newline at end of file
@@ -2,121 +2,256 @@
 Logger module for the Tello Drone Control application.
 """
 
+import re
+import sys
 import time
+import atexit
 import builtins
+import logging
+import collections
+import threading
+
+from utils.config import Level, LEVEL_NAMES, LOG_QUEUE_SIZE, MAX_LOG_MSG_LEN
 
 # Store reference to original print to avoid recursion
 _original_print = builtins.print
 
+# Console prefixes indexed by Level, built once
+_PREFIX = tuple(f"[{name}] " for name in LEVEL_NAMES)
+
+# One queued log line; a tuple is much smaller than a per-entry dict
+LogEntry = collections.namedtuple("LogEntry", "ts level msg")
+
+_NAME_TO_LEVEL = {level.name: level for level in Level}
+
+def to_level(level):
+    """Convert a level name or number to a Level; unknown names map to INFO."""
+    if type(level) is Level:
+        return level  # the common case: callers pass Level constants
+    if type(level) is str:
+        return _NAME_TO_LEVEL.get(level, Level.INFO)
+    return Level(level)
+
+# Last formatted timestamp as (whole second, "HH:MM:SS"), swapped as one tuple
+_ts_cache = (0, "")
+
+def _now_hms():
+    """Return the current time as HH:MM:SS, formatting at most once per second."""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _ts_cache[1]
+
+# Levels that are never rate-limited
+_UNTHROTTLED = (Level.ERROR, Level.COMMAND)
+
 class Logger:
     """
     Logger class to handle application logging with multiple levels and GUI integration.
     """
-    def __init__(self, log_queue=None, max_logs=100):
-        """Initialize the logger with a queue for GUI display."""
-        self.log_queue = log_queue
+    def __init__(self, log_queue=None, max_logs=LOG_QUEUE_SIZE, flush_interval=0.05, flush_bytes=65536,
+                 rate_limit=200):
+        """Initialize the logger with a bounded deque of recent entries for GUI display."""
+        # deque(maxlen=...) drops the oldest entry on append without any locking
+        self.log_queue = log_queue if log_queue is not None else collections.deque(maxlen=max_logs)
         self.max_logs = max_logs
         self.gui_instance = None
         self.gui_ready = False
+        self._write_display = None  # log display's write_logs, resolved in set_gui_instance
+        
+        # Entries are buffered and handed on as one batch, at most flush_interval
+        # seconds later or as soon as flush_bytes of messages have piled up
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self._buffer = collections.deque()
+        self._console_lines = []  # written to stdout by the flush, not the caller
+        self._buffer_bytes = 0
+        self._buffer_lock = threading.Lock()
+        self._flush_timer = None
+        
+        # Per-level token buckets ([tokens, last refill]) holding each level to
+        # rate_limit lines per second; dropped lines are summarized once a second
+        self.rate_limit = rate_limit
+        self._tokens = [[rate_limit, time.monotonic()] for _ in Level]
+        self._dropped = [0] * len(Level)
+        self._last_drop_report = 0.0
     
     def set_gui_instance(self, gui_instance):
         """Set the GUI instance for direct logging."""
         self.gui_instance = gui_instance
-        # Check if GUI has log_display attribute
-        self.gui_ready = hasattr(gui_instance, 'log_display')
+        # Resolve the log display's writer once instead of on every flush
+        log_display = getattr(gui_instance, 'log_display', None)
+        self.gui_ready = log_display is not None
+        self._write_display = getattr(log_display, 'write_logs', None)
     
-    def log(self, message, level="INFO"):
-        """Log a message with specified level."""
-        # Print to console using the original print to avoid recursion
-        _original_print(f"[{level}] {message}")
+    def log(self, message, level=Level.INFO, console=True):
+        """Log a message with specified level (a Level or its name)."""
+        level = to_level(level)
         
-        # Add to queue if available
-        if self.log_queue:
-            timestamp = time.strftime("%H:%M:%S")
-            log_entry = {
-                "timestamp": timestamp,
-                "message": message,
-                "level": level
-            }
+        # Accept anything printable, as the old f-string did
+        if type(message) is not str:
+            message = str(message)
+        
+        # Cap what moves through the buffer and into the Text widget
+        if len(message) > MAX_LOG_MSG_LEN:
+            message = f"{message[:MAX_LOG_MSG_LEN]}…(+{len(message) - MAX_LOG_MSG_LEN})"
+        
+        # Console lines are queued too, so the calling thread never blocks on stdout
+        line = _PREFIX[level] + message + "\n" if console else None
+        self._enqueue(_now_hms(), message, level, line)
+    
+    def _take_token(self, level):
+        """Spend one of the level's tokens, or count the line as dropped if none are left (buffer lock held)."""
+        bucket = self._tokens[level]
+        now = time.monotonic()
+        tokens = min(self.rate_limit, bucket[0] + (now - bucket[1]) * self.rate_limit)
+        bucket[1] = now
+        if tokens < 1:
+            bucket[0] = tokens
+            self._dropped[level] += 1
+            self._arm_flush(self.flush_interval)  # make sure the drop gets reported
+            return False
+        bucket[0] = tokens - 1
+        return True
+    
+    def _arm_flush(self, delay):
+        """Start the flush timer if it is not already running (buffer lock held)."""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(delay, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _enqueue(self, timestamp, message, level, console_line=None):
+        """Buffer an entry and make sure a flush is pending."""
+        with self._buffer_lock:
+            # Throttle tight-loop spam; errors and commands always get through
+            if level not in _UNTHROTTLED and not self._take_token(level):
+                return
             
-            if self.log_queue.full():
-                try:
-                    self.log_queue.get_nowait()  # Remove oldest log
-                except:
-                    pass
+            self._buffer.append(LogEntry(timestamp, level, message))
+            if console_line:
+                self._console_lines.append(console_line)
+            self._buffer_bytes += len(message)
+            flush_now = self._buffer_bytes > self.flush_bytes
+            if not flush_now:
+                self._arm_flush(self.flush_interval)
+        
+        if flush_now:
+            self.flush()
+    
+    def flush(self):
+        """Hand all buffered entries to the log queue and the GUI as one batch."""
+        with self._buffer_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            batch = list(self._buffer)
+            self._buffer.clear()
+            lines, self._console_lines = self._console_lines, []
+            self._buffer_bytes = 0
             
-            try:
-                self.log_queue.put_nowait(log_entry)
-            except:
-                pass
+            # Summarize rate-limited lines at most once a second
+            if any(self._dropped):
+                now = time.monotonic()
+                wait = self._last_drop_report + 1.0 - now
+                if wait <= 0:
+                    timestamp = _now_hms()
+                    for level, count in enumerate(self._dropped):
+                        if count:
+                            message = f"[suppressed {count} {LEVEL_NAMES[level]} messages]"
+                            batch.append(LogEntry(timestamp, Level(level), message))
+                            lines.append(_PREFIX[level] + message + "\n")
+                    self._dropped = [0] * len(Level)
+                    self._last_drop_report = now
+                else:
+                    self._arm_flush(wait)
         
-        # Log directly to GUI if available and ready
-        if self.gui_ready and self.gui_instance and hasattr(self.gui_instance, 'log_display'):
+        if not batch:
+            return
+        
+        # One console write per batch, on the flush timer's thread
+        if lines and sys.stdout is not None:
             try:
-                # Using direct call to log_display to avoid recursion
-                self.gui_instance.log_display.add_log(message, level)
+                sys.stdout.write("".join(lines))
+                sys.stdout.flush()
             except Exception:
-                # GUI not fully initialized yet or other error
                 pass
+        
+        # Keep the most recent entries; the oldest fall off the bounded deque.
+        # The GUI polls this from its own thread via flush_to_display(), since
+        # Tk must not be called from the flush timer's thread
+        self.log_queue.extend(batch)
+    
+    def flush_to_display(self):
+        """Write every queued entry to the attached log display; call from the Tk thread only."""
+        if self._write_display is None or not self.log_queue:
+            return
+        self._write_display(list(self.drain()))
+    
+    def drain(self):
+        """Yield and remove queued LogEntry records, oldest first."""
+        while self.log_queue:
+            yield self.log_queue.popleft()
     
     def clear(self):
-        """Clear the log queue."""
-        if self.log_queue:
-            while not self.log_queue.empty():
-                try:
-                    self.log_queue.get_nowait()
-                except:
-                    break
+        """Clear the log queue and any entries still waiting to be flushed."""
+        with self._buffer_lock:
+            self._buffer.clear()
+            self._console_lines = []
+            self._buffer_bytes = 0
+        
+        self.log_queue.clear()
 
 # Create a global logger instance
 logger = Logger()
 
-# Custom print function to redirect to logger
-def custom_print(*args, **kwargs):
-    """Replacement for built-in print that logs to the GUI."""
-    # Call original print for console output
-    _original_print(*args, **kwargs)
-    
-    # Log to the global logger
-    message = " ".join(map(str, args))
-    
-    # Determine level based on content
-    level = "INFO"
-    if "error" in message.lower() or "exception" in message.lower():
-        level = "ERROR"
-    elif "command" in message.lower() or "executing" in message.lower():
-        level = "COMMAND"
-    elif "gesture" in message.lower():
-        level = "GESTURE"
-    elif "whisper" in message.lower() or "audio" in message.lower() or "speech" in message.lower():
-        level = "SPEECH"
-    elif "vlm" in message.lower() or "llava" in message.lower():
-        level = "VLM"
-    
-    # Only add to queue if available
-    if hasattr(logger, 'log_queue') and logger.log_queue:
+# Console lines wait for the flush timer; write whatever is left at exit
+atexit.register(logger.flush)
+
+# Keyword groups in priority order, matched case-insensitively in one scan
+_LEVEL_RE = re.compile(r"(?i)(error|exception)|(command|executing)|(gesture)|(whisper|audio|speech)|(vlm|llava)")
+_LEVEL_FOR_GROUP = (Level.ERROR, Level.COMMAND, Level.GESTURE, Level.SPEECH, Level.VLM)
+
+def classify_level(message):
+    """Pick a GUI log level from the message content."""
+    # Keep the highest-priority group seen, so "gesture error" is still an error
+    best = None
+    for match in _LEVEL_RE.finditer(message):
+        group = match.lastindex - 1
+        if best is None or group < best:
+            best = group
+            if group == 0:
+                break
+    return Level.INFO if best is None else _LEVEL_FOR_GROUP[best]
+
+class GuiLogHandler(logging.Handler):
+    """
+    Logging handler that forwards records to the global logger for GUI display.
+    Console output is left to the regular logging handlers.
+    """
+    def emit(self, record):
         try:
-            timestamp = time.strftime("%H:%M:%S")
-            log_entry = {
-                "timestamp": timestamp,
-                "message": message,
-                "level": level
-            }
-            
-            if logger.log_queue.full():
-                try:
-                    logger.log_queue.get_nowait()  # Remove oldest log
-                except:
-                    pass
-            logger.log_queue.put_nowait(log_entry)
+            message = self.format(record)
+            if record.levelno >= logging.ERROR:
+                level = Level.ERROR
+            elif record.levelno < logging.INFO:
+                level = Level.DEBUG
+            else:
+                level = classify_level(message)
+            logger.log(message, level, console=False)
         except Exception:
-            pass  # Silently ignore queue errors
+            self.handleError(record)
+
+# Custom print function to redirect to logger
+def custom_print(*args, _print=_original_print, _logger=logger, _classify=classify_level, **kwargs):
+    """Replacement for built-in print that logs to the GUI."""
+    # Call original print for console output (globals bound as defaults for fast lookup)
+    _print(*args, **kwargs)
     
-    # Only try to log to GUI if the gui is ready and all components exist
-    try:
-        if (logger.gui_ready and logger.gui_instance and 
-            hasattr(logger.gui_instance, 'log_display') and 
-            logger.gui_instance.log_display is not None):
-            logger.gui_instance.log_display.add_log(message, level)
-    except Exception:
-        pass  # Silently ignore GUI errors 
\ No newline at end of file
+    # Log to the global logger; the console already has the line
+    if len(args) == 1 and type(args[0]) is str:
+        message = args[0]
+    else:
+        message = " ".join(a if type(a) is str else str(a) for a in args)
+    _logger.log(message, _classify(message), console=False)